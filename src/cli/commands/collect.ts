@@ -5,11 +5,14 @@
 
 import * as fs from 'fs-extra';
 import * as path from 'path';
+import * as readline from 'readline';
+import { pipeline } from 'stream/promises';
 import chalk from 'chalk';
 import ora from 'ora';
 import { v4 as uuidv4 } from 'uuid';
 import { Trace } from '../../core/types';
-import { TraceStore } from '../../core/storage';
+import { JSONL_READ_BUFFER_SIZE } from '../../core/storage';
+import { PROGRESS_UPDATE_INTERVAL } from '../../utils/logger';
 
 interface CollectOptions {
   output: string;
@@ -29,23 +32,47 @@ export async function collectCommand(source: string, options: CollectOptions): P
       process.exit(1);
     }
 
-    // Read source file
-    const sourceContent = await fs.readFile(source, 'utf-8');
-    const lines = sourceContent.split('\n').filter(line => line.trim());
-    
-    spinner.text = `Found ${lines.length} lines, processing...`;
+    // Output is appended while the source is still being read, so the
+    // same file would keep feeding its own output back in
+    if (await isSameFile(source, options.output)) {
+      spinner.fail(`Output file must differ from source: ${source}`);
+      process.exit(1);
+    }
+
+    spinner.text = 'Reading and processing lines...';
 
-    // Parse and transform traces
-    const traces: Trace[] = [];
+    // Stream source file line by line so --limit stops reading early
+    const fileStream = fs.createReadStream(source, { highWaterMark: JSONL_READ_BUFFER_SIZE });
+    const rl = readline.createInterface({
+      input: fileStream,
+      crlfDelay: Infinity,
+    });
+
+    // Parse, transform and write traces as they are read, so memory
+    // stays flat regardless of source size
+    let collected = 0;
+    let sample: Trace | undefined;
+    let lineCount = 0;
     let skipped = 0;
 
-    for (let i = 0; i < lines.length; i++) {
-      if (options.limit && traces.length >= options.limit) break;
+    async function* serializeTraces(): AsyncGenerator<string> {
+      for await (const line of rl) {
+        if (!line.trim()) continue;
+        if (options.limit && collected >= options.limit) break;
+
+        lineCount++;
+        if (lineCount % PROGRESS_UPDATE_INTERVAL === 0) {
+          spinner.text = `Read ${lineCount} lines, processing...`;
+        }
+
+        let trace: Trace;
+        try {
+          trace = transformToTrace(JSON.parse(line));
+        } catch (e) {
+          skipped++;
+          continue;
+        }
 
-      try {
-        const rawData = JSON.parse(lines[i]);
-        const trace = transformToTrace(rawData);
-        
         // Apply filter if specified
         if (options.filter) {
           const filterLower = options.filter.toLowerCase();
@@ -58,29 +85,30 @@ export async function collectCommand(source: string, options: CollectOptions): P
           }
         }
 
-        traces.push(trace);
-      } catch (e) {
-        skipped++;
-        continue;
+        collected++;
+        sample = sample ?? trace;
+        yield JSON.stringify(trace) + '\n';
       }
     }
 
-    spinner.succeed(`Processed ${lines.length} lines`);
+    try {
+      await pipeline(serializeTraces(), fs.createWriteStream(options.output, { flags: 'a' }));
+    } finally {
+      // Release the source even if the limit was hit or the write failed
+      fileStream.destroy();
+    }
 
-    // Save traces
-    const store = new TraceStore(options.output);
-    await store.appendMany(traces);
+    spinner.succeed(`Processed ${lineCount} lines`);
 
-    console.log(chalk.green(`\n✅ Collected ${traces.length} traces`));
+    console.log(chalk.green(`\n✅ Collected ${collected} traces`));
     if (skipped > 0) {
       console.log(chalk.yellow(`   Skipped ${skipped} invalid/filtered lines`));
     }
     console.log(chalk.gray(`   Saved to: ${path.resolve(options.output)}`));
 
     // Show sample
-    if (traces.length > 0) {
+    if (sample) {
       console.log(chalk.blue('\n📋 Sample trace:'));
-      const sample = traces[0];
       console.log(`   ID: ${sample.id}`);
       console.log(`   Query: ${sample.query.substring(0, 80)}...`);
       console.log(`   Provider: ${sample.metadata?.provider ?? 'unknown'}`);
@@ -94,6 +122,19 @@ export async function collectCommand(source: string, options: CollectOptions): P
   }
 }
 
+/**
+ * Check whether two paths refer to the same file on disk.
+ * Compares device and inode, so symlinks, hard links and
+ * case-insensitive path variants are all detected.
+ */
+async function isSameFile(a: string, b: string): Promise<boolean> {
+  if (!(await fs.pathExists(b))) {
+    return false;
+  }
+  const [statA, statB] = await Promise.all([fs.stat(a), fs.stat(b)]);
+  return statA.dev === statB.dev && statA.ino === statB.ino;
+}
+
 /**
  * Transform various input formats to standard Trace format
  */
@@ -33,10 +33,11 @@ export const demoCommand = new Command('demo')
     try {
       // Step 1: Create demo project
       await runStep('Setup', 'Creating demo project...', async () => {
-        await fs.ensureDir(demoDir);
-        await fs.ensureDir(path.join(demoDir, 'traces'));
-        await fs.ensureDir(path.join(demoDir, 'evals'));
-        await fs.ensureDir(path.join(demoDir, 'reports'));
+        // ensureDir is recursive, so this also creates demoDir itself
+        const dirs = ['traces', 'evals', 'reports'];
+        for (const dir of dirs) {
+          await fs.ensureDir(path.join(demoDir, dir));
+        }
         console.log(chalk.green(`  ✓ Created demo project at ${demoDir}`));
       });
       
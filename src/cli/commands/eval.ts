@@ -27,6 +27,7 @@ interface RunEvalOptions {
   filter?: string[];
   stopOnFail?: boolean;
   output?: string;
+  concurrency?: number;
 }
 
 /**
@@ -122,6 +123,12 @@ export async function runEvalCommand(options: RunEvalOptions): Promise<void> {
   const spinner = ora('Loading traces').start();
 
   try {
+    const concurrency = options.concurrency ?? 1;
+    if (!Number.isInteger(concurrency) || concurrency < 1) {
+      spinner.fail(`Invalid concurrency: ${concurrency} (must be a positive integer)`);
+      process.exit(1);
+    }
+
     // Load traces
     const traceStore = new TraceStore(options.traces);
     const traces = await traceStore.loadAll();
@@ -157,26 +164,41 @@ export async function runEvalCommand(options: RunEvalOptions): Promise<void> {
 
     spinner.text = `Running ${evalConfigs.length} eval(s) on ${traces.length} traces...`;
 
-    // Run evals
+    // Run evals with a bounded pool of workers; LLM-judge calls are
+    // I/O-bound, so traces can be evaluated in parallel (opt-in)
+    const traceResultsList: EvalResult[][] = new Array(traces.length);
+    let nextIndex = 0;
+    let completed = 0;
+
+    async function worker(): Promise<void> {
+      while (nextIndex < traces.length) {
+        const i = nextIndex++;
+        traceResultsList[i] = await registry.runAll(traces[i], {
+          filter: options.filter,
+          stopOnFail: options.stopOnFail,
+        });
+        completed++;
+        spinner.text = `Processing trace ${completed}/${traces.length}...`;
+      }
+    }
+
+    await Promise.all(
+      Array.from({ length: Math.min(concurrency, traces.length) }, () => worker())
+    );
+
+    // Collect results in trace order
     const results: Map<string, EvalResult[]> = new Map();
     let passed = 0;
     let failed = 0;
 
     for (let i = 0; i < traces.length; i++) {
-      const trace = traces[i];
-      const traceResults = await registry.runAll(trace, {
-        filter: options.filter,
-        stopOnFail: options.stopOnFail,
-      });
-
-      results.set(trace.id, traceResults);
+      const traceResults = traceResultsList[i];
+      results.set(traces[i].id, traceResults);
 
       // Count passes/fails
       const allPassed = traceResults.every(r => r.passed);
       if (allPassed) passed++;
       else failed++;
-
-      spinner.text = `Processing trace ${i + 1}/${traces.length}...`;
     }
 
     spinner.succeed(`Evaluated ${traces.length} traces`);
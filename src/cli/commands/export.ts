@@ -11,7 +11,7 @@ import * as path from 'path';
 import chalk from 'chalk';
 import ora from 'ora';
 import { Trace, Annotation, EvalResult } from '../../core/types';
-import { TraceStore, AnnotationStore } from '../../core/storage';
+import { TraceStore, AnnotationStore, indexAnnotationsByTrace } from '../../core/storage';
 
 interface ExportOptions {
   traces: string;
@@ -292,10 +292,11 @@ async function exportToMarkdown(
   lines.push('\n');
 
   // Traces
+  const annotationByTrace = indexAnnotationsByTrace(annotations);
   lines.push('## Traces\n');
   for (let i = 0; i < traces.length; i++) {
     const trace = traces[i];
-    const annotation = annotations.find(a => a.traceId === trace.id);
+    const annotation = annotationByTrace.get(trace.id);
     const evals = evalResults[trace.id];
 
     lines.push(`### Trace ${i + 1}\n`);
@@ -352,6 +353,7 @@ async function exportToJson(
   evalResults: Record<string, EvalResult[]>,
   options: ExportOptions
 ): Promise<void> {
+  const annotationByTrace = indexAnnotationsByTrace(annotations);
   const data = {
     metadata: {
       exportedAt: new Date().toISOString(),
@@ -361,7 +363,7 @@ async function exportToJson(
       version: '1.0',
     },
     traces: traces.map(trace => {
-      const annotation = annotations.find(a => a.traceId === trace.id);
+      const annotation = annotationByTrace.get(trace.id);
       const evals = evalResults[trace.id];
 
       return {
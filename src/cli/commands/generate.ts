@@ -12,6 +12,7 @@ import ora from 'ora';
 import { v4 as uuidv4 } from 'uuid';
 import { Trace, TraceMetadata } from '../../core/types';
 import { TraceStore } from '../../core/storage';
+import { PROGRESS_UPDATE_INTERVAL } from '../../utils/logger';
 
 const DEFAULT_DIMENSIONS_TEMPLATE = `# Synthetic Data Dimensions
 # Define dimensions to generate varied synthetic traces
@@ -153,7 +154,9 @@ export async function createCommand(options: CreateOptions): Promise<void> {
       const trace = generateSyntheticTrace(i, selectedDimensions, options);
       traces.push(trace);
 
-      spinner.text = `Generated trace ${i + 1}/${options.count}...`;
+      if ((i + 1) % PROGRESS_UPDATE_INTERVAL === 0) {
+        spinner.text = `Generated trace ${i + 1}/${options.count}...`;
+      }
     }
 
     spinner.succeed(`Generated ${traces.length} synthetic traces`);
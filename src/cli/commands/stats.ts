@@ -26,30 +26,19 @@ export async function statsCommand(tracesPath: string, options: StatsOptions): P
       process.exit(1);
     }
 
-    const traceStore = new TraceStore(tracesPath);
-    const traces = await traceStore.loadAll();
+    // Load traces, annotations and taxonomy concurrently
+    // (missing annotation/taxonomy files load as empty)
+    const [traces, annotations, taxonomy] = await Promise.all([
+      new TraceStore(tracesPath).loadAll(),
+      new AnnotationStore(options.annotations || 'annotations.jsonl').loadAll(),
+      new TaxonomyStore(options.taxonomy || 'taxonomy.json').load(),
+    ]);
 
     if (traces.length === 0) {
       console.log(chalk.yellow('No traces found.'));
       return;
     }
 
-    // Load annotations if provided
-    let annotations: Annotation[] = [];
-    const annotationsPath = options.annotations || 'annotations.jsonl';
-    if (await fs.pathExists(annotationsPath)) {
-      const annotationStore = new AnnotationStore(annotationsPath);
-      annotations = await annotationStore.loadAll();
-    }
-
-    // Load taxonomy if provided
-    let taxonomy: FailureTaxonomy | null = null;
-    const taxonomyPath = options.taxonomy || 'taxonomy.json';
-    if (await fs.pathExists(taxonomyPath)) {
-      const taxonomyStore = new TaxonomyStore(taxonomyPath);
-      taxonomy = await taxonomyStore.load();
-    }
-
     // Calculate stats
     const stats = calculateStats(traces.length, annotations, taxonomy);
 
@@ -4,7 +4,7 @@
  */
 
 import chalk from 'chalk';
-import { TraceStore, AnnotationStore } from '../../core/storage';
+import { TraceStore, AnnotationStore, indexAnnotationsByTrace } from '../../core/storage';
 import { Annotation } from '../../core/types';
 
 interface ViewOptions {
@@ -16,27 +16,26 @@ export async function viewCommand(tracesPath: string, options: ViewOptions): Pro
   console.log(chalk.blue.bold('🔍 Viewing traces (read-only)\n'));
 
   try {
-    // Load traces
-    const traceStore = new TraceStore(tracesPath);
-    const traces = await traceStore.loadAll();
+    // Load traces and annotations concurrently
+    const [traces, annotations] = await Promise.all([
+      new TraceStore(tracesPath).loadAll(),
+      options.annotations
+        ? new AnnotationStore(options.annotations).loadAll()
+        : Promise.resolve<Annotation[]>([]),
+    ]);
 
     if (traces.length === 0) {
       console.log(chalk.yellow('No traces found.'));
       return;
     }
 
-    // Load annotations if provided
-    let annotations: Annotation[] = [];
-    if (options.annotations) {
-      const annotationStore = new AnnotationStore(options.annotations);
-      annotations = await annotationStore.loadAll();
-    }
+    const annotationByTrace = indexAnnotationsByTrace(annotations);
 
     // Filter traces if specified
     let displayTraces = traces;
     if (options.filter) {
       displayTraces = traces.filter(t => {
-        const annotation = annotations.find(a => a.traceId === t.id);
+        const annotation = annotationByTrace.get(t.id);
         return annotation?.failureCategory === options.filter;
       });
     }
@@ -46,7 +45,7 @@ export async function viewCommand(tracesPath: string, options: ViewOptions): Pro
     // Simple terminal viewer (non-interactive for now)
     for (let i = 0; i < displayTraces.length; i++) {
       const trace = displayTraces[i];
-      const annotation = annotations.find(a => a.traceId === trace.id);
+      const annotation = annotationByTrace.get(trace.id);
 
       console.log(chalk.gray('='.repeat(80)));
       console.log(chalk.white.bold(`Trace ${i + 1}/${displayTraces.length} | ID: ${trace.id}`));
@@ -7,7 +7,7 @@
 import * as dotenv from 'dotenv';
 import * as path from 'path';
 import * as fs from 'fs-extra';
-import { Command } from 'commander';
+import { Command, InvalidArgumentError } from 'commander';
 import chalk from 'chalk';
 
 // Load environment variables
@@ -47,6 +47,17 @@ import { authCommand } from './commands/auth';
 import { doctorCommand } from './commands/doctor';
 import { demoCommand } from './commands/demo';
 
+/**
+ * Parse an option value that must be a positive integer
+ */
+function parsePositiveInt(value: string): number {
+  const parsed = Number(value);
+  if (!Number.isInteger(parsed) || parsed < 1) {
+    throw new InvalidArgumentError('Must be a positive integer.');
+  }
+  return parsed;
+}
+
 const program = new Command();
 
 program
@@ -129,6 +140,7 @@ program
       .requiredOption('-c, --config <file>', 'Eval config file')
       .option('-o, --output <file>', 'Results output', 'eval-results.jsonl')
       .option('--stop-on-fail', 'Stop on first failure (cheap evals only)')
+      .option('--concurrency <n>', 'Number of traces to evaluate in parallel', parsePositiveInt, 1)
       .action((traces, options) => runEvalCommand({ ...options, traces }))
   )
   .addCommand(
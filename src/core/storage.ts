@@ -7,6 +7,12 @@ import * as fs from 'fs-extra';
 import * as readline from 'readline';
 import { Trace, Annotation, FailureTaxonomy } from '../core/types';
 
+/**
+ * Read buffer size for JSONL streams (default is 64 KiB).
+ * Larger chunks mean fewer read syscalls on multi-MB trace files.
+ */
+export const JSONL_READ_BUFFER_SIZE = 1 << 20;
+
 export class TraceStore {
   private filePath: string;
 
@@ -21,7 +27,7 @@ export class TraceStore {
       return traces;
     }
 
-    const fileStream = fs.createReadStream(this.filePath);
+    const fileStream = fs.createReadStream(this.filePath, { highWaterMark: JSONL_READ_BUFFER_SIZE });
     const rl = readline.createInterface({
       input: fileStream,
       crlfDelay: Infinity,
@@ -63,7 +69,7 @@ export class TraceStore {
       return count;
     }
 
-    const fileStream = fs.createReadStream(this.filePath);
+    const fileStream = fs.createReadStream(this.filePath, { highWaterMark: JSONL_READ_BUFFER_SIZE });
     const rl = readline.createInterface({
       input: fileStream,
       crlfDelay: Infinity,
@@ -91,7 +97,7 @@ export class AnnotationStore {
       return annotations;
     }
 
-    const fileStream = fs.createReadStream(this.filePath);
+    const fileStream = fs.createReadStream(this.filePath, { highWaterMark: JSONL_READ_BUFFER_SIZE });
     const rl = readline.createInterface({
       input: fileStream,
       crlfDelay: Infinity,
@@ -140,15 +146,18 @@ export class AnnotationStore {
   }> {
     const annotations = await this.loadAll();
     const total = annotations.length;
-    const passed = annotations.filter(a => a.label === 'pass').length;
-    const failed = annotations.filter(a => a.label === 'fail').length;
+    let passed = 0;
+    let failed = 0;
     
+    // Single pass over annotations for counts and categories
     const byCategory: Record<string, number> = {};
-    annotations.forEach(a => {
+    for (const a of annotations) {
+      if (a.label === 'pass') passed++;
+      else if (a.label === 'fail') failed++;
       if (a.failureCategory) {
         byCategory[a.failureCategory] = (byCategory[a.failureCategory] || 0) + 1;
       }
-    });
+    }
 
     return {
       total,
@@ -160,6 +169,19 @@ export class AnnotationStore {
   }
 }
 
+/**
+ * Index annotations by trace ID (first annotation per trace wins)
+ */
+export function indexAnnotationsByTrace(annotations: Annotation[]): Map<string, Annotation> {
+  const byTrace = new Map<string, Annotation>();
+  for (const annotation of annotations) {
+    if (!byTrace.has(annotation.traceId)) {
+      byTrace.set(annotation.traceId, annotation);
+    }
+  }
+  return byTrace;
+}
+
 export class TaxonomyStore {
   private filePath: string;
 
@@ -14,14 +14,14 @@
  * - EMBEDEVAL_PROVIDER: Default provider (gemini, openai)
  */
 
-import { GoogleGenerativeAI } from '@google/generative-ai';
+import { GoogleGenerativeAI, GoogleGenerativeAIError } from '@google/generative-ai';
 import { logger } from './logger';
 
 // ==================== TYPES ====================
 
 export interface LLMProvider {
   name: string;
-  judge(prompt: string, model: string, temperature: number): Promise<string>;
+  judge(prompt: string, model: string, temperature: number, retry?: RetryOptions): Promise<string>;
   isAvailable(): boolean;
 }
 
@@ -88,6 +88,84 @@ export const DEFAULT_MODELS = {
   complex: 'gemini-3-pro',         // For complex reasoning tasks
 } as const;
 
+// ==================== RETRY ====================
+
+const RETRY_ATTEMPTS = 3;
+const RETRY_BASE_DELAY_MS = 1000;
+
+// Socket/DNS error codes (Node and undici) worth retrying
+const TRANSIENT_NETWORK_CODES = new Set([
+  'ECONNRESET',
+  'ECONNREFUSED',
+  'ETIMEDOUT',
+  'ENOTFOUND',
+  'EAI_AGAIN',
+  'EPIPE',
+  'UND_ERR_SOCKET',
+  'UND_ERR_CLOSED',
+  'UND_ERR_CONNECT_TIMEOUT',
+  'UND_ERR_HEADERS_TIMEOUT',
+  'UND_ERR_BODY_TIMEOUT',
+]);
+
+/**
+ * API error that keeps the HTTP status, so transient failures
+ * (429, 5xx) can be told apart from permanent ones (400, 401)
+ */
+export class ProviderAPIError extends Error {
+  constructor(message: string, public status: number) {
+    super(message);
+    this.name = 'ProviderAPIError';
+  }
+}
+
+export function isTransientError(error: unknown): boolean {
+  // ProviderAPIError and Gemini SDK HTTP errors both expose `status`
+  const status = (error as { status?: unknown } | null)?.status;
+  if (typeof status === 'number') {
+    return status === 429 || status >= 500;
+  }
+  // The Gemini SDK rethrows fetch network failures as a plain
+  // GoogleGenerativeAIError ("Error fetching from <url>: ...")
+  if (error instanceof GoogleGenerativeAIError) {
+    return error.message.includes('Error fetching from');
+  }
+  // fetch() rejects with a TypeError both for network failures and for
+  // permanent mistakes (bad URL, unknown scheme); only the former carry
+  // a socket/DNS error code on `cause`
+  if (error instanceof TypeError) {
+    const code = (error.cause as { code?: unknown } | undefined)?.code;
+    return typeof code === 'string' && TRANSIENT_NETWORK_CODES.has(code);
+  }
+  return false;
+}
+
+export interface RetryOptions {
+  attempts?: number;
+  baseDelayMs?: number;
+}
+
+/**
+ * Retry a provider call on transient failures with exponential backoff
+ */
+export async function withRetry<T>(fn: () => Promise<T>, options: RetryOptions = {}): Promise<T> {
+  const attempts = options.attempts ?? RETRY_ATTEMPTS;
+  const baseDelayMs = options.baseDelayMs ?? RETRY_BASE_DELAY_MS;
+
+  for (let attempt = 1; ; attempt++) {
+    try {
+      return await fn();
+    } catch (error) {
+      if (attempt >= attempts || !isTransientError(error)) {
+        throw error;
+      }
+      const delay = baseDelayMs * 2 ** (attempt - 1);
+      logger.debug(`Transient provider error, retrying in ${delay}ms (attempt ${attempt}/${attempts})`);
+      await new Promise(resolve => setTimeout(resolve, delay));
+    }
+  }
+}
+
 // ==================== GEMINI PROVIDER ====================
 
 export class GeminiProvider implements LLMProvider {
@@ -104,13 +182,12 @@ export class GeminiProvider implements LLMProvider {
     }
   }
 
-  async judge(prompt: string, model: string, temperature: number): Promise<string> {
+  async judge(prompt: string, model: string, temperature: number, retry?: RetryOptions): Promise<string> {
     if (!this.client) {
       throw new Error('Gemini client not initialized - set GEMINI_API_KEY');
     }
 
     const modelName = model || DEFAULT_MODELS.judge;
-    const startTime = Date.now();
     
     const genModel = this.client.getGenerativeModel({ 
       model: modelName,
@@ -120,12 +197,14 @@ export class GeminiProvider implements LLMProvider {
       }
     });
 
-    const result = await genModel.generateContent(prompt);
-    const response = result.response;
-    const latency = Date.now() - startTime;
-    
-    logger.debug(`Gemini ${modelName} responded in ${latency}ms`);
-    return response.text();
+    const result = await withRetry(async () => {
+      // Time each attempt so backoff delays don't inflate the reported latency
+      const startTime = Date.now();
+      const attemptResult = await genModel.generateContent(prompt);
+      logger.debug(`Gemini ${modelName} responded in ${Date.now() - startTime}ms`);
+      return attemptResult;
+    }, retry);
+    return result.response.text();
   }
 
   isAvailable(): boolean {
@@ -163,13 +242,12 @@ export class OpenAICompatibleProvider implements LLMProvider {
     return 'openai';
   }
 
-  async judge(prompt: string, model: string, temperature: number): Promise<string> {
+  async judge(prompt: string, model: string, temperature: number, retry?: RetryOptions): Promise<string> {
     if (!this.apiKey && !this.baseUrl.includes('localhost')) {
       throw new Error(`${this.name} API key not set`);
     }
 
     const modelName = model || 'gpt-4o-mini';
-    const startTime = Date.now();
 
     const headers: Record<string, string> = {
       'Content-Type': 'application/json',
@@ -185,26 +263,29 @@ export class OpenAICompatibleProvider implements LLMProvider {
       headers['X-Title'] = 'EmbedEval';
     }
 
-    const response = await fetch(`${this.baseUrl}/chat/completions`, {
-      method: 'POST',
-      headers,
-      body: JSON.stringify({
-        model: modelName,
-        messages: [{ role: 'user', content: prompt }],
-        temperature: temperature ?? 0.0,
-        max_tokens: 500,
-      }),
-    });
+    const data = await withRetry(async () => {
+      // Time each attempt so backoff delays don't inflate the reported latency
+      const startTime = Date.now();
+      const response = await fetch(`${this.baseUrl}/chat/completions`, {
+        method: 'POST',
+        headers,
+        body: JSON.stringify({
+          model: modelName,
+          messages: [{ role: 'user', content: prompt }],
+          temperature: temperature ?? 0.0,
+          max_tokens: 500,
+        }),
+      });
 
-    if (!response.ok) {
-      const error = await response.text();
-      throw new Error(`${this.name} API error: ${response.status} - ${error}`);
-    }
+      if (!response.ok) {
+        const error = await response.text();
+        throw new ProviderAPIError(`${this.name} API error: ${response.status} - ${error}`, response.status);
+      }
 
-    const data = await response.json();
-    const latency = Date.now() - startTime;
-    
-    logger.debug(`${this.name} ${modelName} responded in ${latency}ms`);
+      const json = await response.json();
+      logger.debug(`${this.name} ${modelName} responded in ${Date.now() - startTime}ms`);
+      return json;
+    }, retry);
     return data.choices[0].message.content;
   }
 
@@ -235,7 +316,7 @@ export class GeminiEmbeddingProvider implements EmbeddingProvider {
       model: model || 'text-embedding-004' 
     });
     
-    const result = await embeddingModel.embedContent(text);
+    const result = await withRetry(() => embeddingModel.embedContent(text));
     return result.embedding.values;
   }
 
@@ -267,24 +348,26 @@ export class OpenAIEmbeddingProvider implements EmbeddingProvider {
       throw new Error('OpenAI API key not set');
     }
 
-    const response = await fetch(`${this.baseUrl}/embeddings`, {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-        'Authorization': `Bearer ${this.apiKey}`,
-      },
-      body: JSON.stringify({
-        model: model || 'text-embedding-3-small',
-        input: text,
-      }),
-    });
+    const data = await withRetry(async () => {
+      const response = await fetch(`${this.baseUrl}/embeddings`, {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+          'Authorization': `Bearer ${this.apiKey}`,
+        },
+        body: JSON.stringify({
+          model: model || 'text-embedding-3-small',
+          input: text,
+        }),
+      });
 
-    if (!response.ok) {
-      const error = await response.text();
-      throw new Error(`OpenAI embedding error: ${response.status} - ${error}`);
-    }
+      if (!response.ok) {
+        const error = await response.text();
+        throw new ProviderAPIError(`OpenAI embedding error: ${response.status} - ${error}`, response.status);
+      }
 
-    const data = await response.json();
+      return response.json();
+    });
     return data.data[0].embedding;
   }
 
@@ -293,24 +376,26 @@ export class OpenAIEmbeddingProvider implements EmbeddingProvider {
       throw new Error('OpenAI API key not set');
     }
 
-    const response = await fetch(`${this.baseUrl}/embeddings`, {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/json',
-        'Authorization': `Bearer ${this.apiKey}`,
-      },
-      body: JSON.stringify({
-        model: model || 'text-embedding-3-small',
-        input: texts,
-      }),
-    });
+    const data = await withRetry(async () => {
+      const response = await fetch(`${this.baseUrl}/embeddings`, {
+        method: 'POST',
+        headers: {
+          'Content-Type': 'application/json',
+          'Authorization': `Bearer ${this.apiKey}`,
+        },
+        body: JSON.stringify({
+          model: model || 'text-embedding-3-small',
+          input: texts,
+        }),
+      });
 
-    if (!response.ok) {
-      const error = await response.text();
-      throw new Error(`OpenAI embedding error: ${response.status} - ${error}`);
-    }
+      if (!response.ok) {
+        const error = await response.text();
+        throw new ProviderAPIError(`OpenAI embedding error: ${response.status} - ${error}`, response.status);
+      }
 
-    const data = await response.json();
+      return response.json();
+    });
     return data.data.map((d: { embedding: number[] }) => d.embedding);
   }
 
@@ -601,7 +686,9 @@ export async function benchmarkProviders(prompt: string = 'Say "PASS" or "FAIL"'
     for (const model of models) {
       const startTime = Date.now();
       try {
-        await provider.judge(prompt, model, 0.0);
+        // A single attempt, so rate limits show up as failures instead of
+        // backoff time folded into the latency
+        await provider.judge(prompt, model, 0.0, { attempts: 1 });
         results.push({
           provider: provider.name,
           model,
@@ -4,6 +4,11 @@
 
 import chalk from 'chalk';
 
+/**
+ * How many rows long-running loops process between spinner text updates
+ */
+export const PROGRESS_UPDATE_INTERVAL = 1000;
+
 export type LogLevel = 'debug' | 'info' | 'warn' | 'error';
 
 class Logger {
@@ -4,6 +4,7 @@
  */
 
 import * as fs from 'fs-extra';
+import fsModule from 'fs-extra';
 import * as path from 'path';
 import * as os from 'os';
 import { collectCommand } from '../../src/cli/commands/collect';
@@ -50,6 +51,90 @@ describe('collect command', () => {
       expect(processExitSpy).toHaveBeenCalledWith(1);
     });
 
+    it('should exit with error when output is the same file as source', async () => {
+      const sourceFile = path.join(tempDir, 'traces.jsonl');
+      const content = JSON.stringify({
+        id: 'trace-001',
+        timestamp: '2024-01-01T10:00:00Z',
+        query: 'Question?',
+        response: 'Answer.',
+        metadata: { provider: 'test', model: 'test-model', latency: 100 },
+      }) + '\n';
+
+      await fs.writeFile(sourceFile, content);
+
+      await expect(
+        collectCommand(sourceFile, { output: path.join(tempDir, '.', 'traces.jsonl') })
+      ).rejects.toThrow('process.exit called');
+
+      expect(processExitSpy).toHaveBeenCalledWith(1);
+      expect(await fs.readFile(sourceFile, 'utf-8')).toBe(content);
+    });
+
+    it('should exit with error when output is a symlink to the source', async () => {
+      const sourceFile = path.join(tempDir, 'traces.jsonl');
+      const linkFile = path.join(tempDir, 'output-link.jsonl');
+      const content = JSON.stringify({
+        id: 'trace-001',
+        timestamp: '2024-01-01T10:00:00Z',
+        query: 'Question?',
+        response: 'Answer.',
+        metadata: { provider: 'test', model: 'test-model', latency: 100 },
+      }) + '\n';
+
+      await fs.writeFile(sourceFile, content);
+      await fs.symlink(sourceFile, linkFile);
+
+      await expect(
+        collectCommand(sourceFile, { output: linkFile })
+      ).rejects.toThrow('process.exit called');
+
+      expect(processExitSpy).toHaveBeenCalledWith(1);
+      expect(await fs.readFile(sourceFile, 'utf-8')).toBe(content);
+    });
+
+    it('should exit with error when output is a hard link to the source', async () => {
+      const sourceFile = path.join(tempDir, 'traces.jsonl');
+      const linkFile = path.join(tempDir, 'output-hardlink.jsonl');
+      const content = JSON.stringify({
+        id: 'trace-001',
+        timestamp: '2024-01-01T10:00:00Z',
+        query: 'Question?',
+        response: 'Answer.',
+        metadata: { provider: 'test', model: 'test-model', latency: 100 },
+      }) + '\n';
+
+      await fs.writeFile(sourceFile, content);
+      await fs.link(sourceFile, linkFile);
+
+      await expect(
+        collectCommand(sourceFile, { output: linkFile })
+      ).rejects.toThrow('process.exit called');
+
+      expect(processExitSpy).toHaveBeenCalledWith(1);
+      expect(await fs.readFile(sourceFile, 'utf-8')).toBe(content);
+    });
+
+    it('should exit with error when output file cannot be written', async () => {
+      const sourceFile = path.join(tempDir, 'traces.jsonl');
+      const outputFile = path.join(tempDir, 'missing-dir', 'output.jsonl');
+
+      await fs.writeFile(sourceFile, JSON.stringify({
+        id: 'trace-001',
+        timestamp: '2024-01-01T10:00:00Z',
+        query: 'Question?',
+        response: 'Answer.',
+        metadata: { provider: 'test', model: 'test-model', latency: 100 },
+      }) + '\n');
+
+      await expect(
+        collectCommand(sourceFile, { output: outputFile })
+      ).rejects.toThrow('process.exit called');
+
+      expect(processExitSpy).toHaveBeenCalledWith(1);
+      expect(await fs.pathExists(outputFile)).toBe(false);
+    });
+
     it('should handle empty source file gracefully', async () => {
       const sourceFile = path.join(tempDir, 'empty.jsonl');
       const outputFile = path.join(tempDir, 'output.jsonl');
@@ -378,6 +463,44 @@ describe('collect command', () => {
       expect(traces).toHaveLength(2);
     });
 
+    it('should stream the source instead of reading it whole', async () => {
+      const sourceFile = path.join(tempDir, 'traces.jsonl');
+      const outputFile = path.join(tempDir, 'output.jsonl');
+
+      const lines: string[] = [];
+      for (let i = 0; i < 3; i++) {
+        lines.push(JSON.stringify({
+          id: `trace-${i.toString().padStart(3, '0')}`,
+          timestamp: '2024-01-01T10:00:00Z',
+          query: `Question ${i}?`,
+          response: `Answer ${i}.`,
+          metadata: { provider: 'test', model: 'test-model', latency: 100 },
+        }));
+      }
+      await fs.writeFile(sourceFile, lines.join('\n') + '\n');
+
+      // Spy on the module object itself; the namespace import is read-only
+      const readFileSpy = jest.spyOn(fsModule, 'readFile');
+      const createReadStreamSpy = jest.spyOn(fsModule, 'createReadStream');
+
+      try {
+        await collectCommand(sourceFile, { output: outputFile, limit: 1 });
+
+        const sourceCalls = (spy: jest.SpyInstance) =>
+          spy.mock.calls.filter(args => args[0] === sourceFile);
+        expect(sourceCalls(readFileSpy)).toHaveLength(0);
+        expect(sourceCalls(createReadStreamSpy)).toHaveLength(1);
+      } finally {
+        readFileSpy.mockRestore();
+        createReadStreamSpy.mockRestore();
+      }
+
+      const store = new TraceStore(outputFile);
+      const traces = await store.loadAll();
+      expect(traces).toHaveLength(1);
+      expect(traces[0].id).toBe('trace-000');
+    });
+
     it('should apply limit before filter', async () => {
       const sourceFile = path.join(tempDir, 'traces.jsonl');
       const outputFile = path.join(tempDir, 'output.jsonl');
@@ -12,6 +12,7 @@ import {
   runEvalCommand,
   reportEvalCommand,
 } from '../../src/cli/commands/eval';
+import { EvalRegistry } from '../../src/evals/engine';
 import { Trace, EvalConfig } from '../../src/core/types';
 
 // Mock process.exit to prevent test termination
@@ -615,6 +616,107 @@ describe('Eval CLI Commands', () => {
     });
   });
 
+  // ==================== CONCURRENCY ====================
+
+  describe('runEvalCommand with concurrency', () => {
+    let tracesFilePath: string;
+    let evalsFilePath: string;
+    let runAllSpy: jest.SpyInstance;
+    let inFlight: number;
+    let maxInFlight: number;
+
+    // Later traces finish first, so completion order differs from trace order
+    const traceIds = ['trace-a', 'trace-b', 'trace-c', 'trace-d', 'trace-e'];
+    const delays: Record<string, number> = {
+      'trace-a': 50, 'trace-b': 40, 'trace-c': 30, 'trace-d': 20, 'trace-e': 10,
+    };
+
+    beforeEach(async () => {
+      tracesFilePath = path.join(tempDir, 'traces.jsonl');
+      evalsFilePath = path.join(tempDir, 'evals.json');
+
+      const traces: Trace[] = traceIds.map(id => ({
+        id,
+        timestamp: new Date().toISOString(),
+        query: 'Question?',
+        response: 'Answer.',
+      }));
+      await fs.writeFile(tracesFilePath, traces.map(t => JSON.stringify(t)).join('\n') + '\n');
+
+      const evals: EvalConfig[] = [
+        {
+          id: 'eval-1',
+          name: 'has-content',
+          type: 'assertion',
+          priority: 'cheap',
+          config: { check: 'response.length > 0' },
+        },
+      ];
+      await fs.writeJson(evalsFilePath, evals);
+
+      inFlight = 0;
+      maxInFlight = 0;
+      runAllSpy = jest.spyOn(EvalRegistry.prototype, 'runAll').mockImplementation(async (trace: Trace) => {
+        inFlight++;
+        maxInFlight = Math.max(maxInFlight, inFlight);
+        await new Promise(resolve => setTimeout(resolve, delays[trace.id]));
+        inFlight--;
+        return [{ evalId: 'eval-1', passed: true, latency: 0 }];
+      });
+    });
+
+    afterEach(() => {
+      runAllSpy.mockRestore();
+    });
+
+    it('should evaluate one trace at a time by default', async () => {
+      await runEvalCommand({
+        traces: tracesFilePath,
+        config: evalsFilePath,
+      });
+
+      expect(runAllSpy).toHaveBeenCalledTimes(5);
+      expect(maxInFlight).toBe(1);
+    });
+
+    it('should not exceed the configured concurrency', async () => {
+      await runEvalCommand({
+        traces: tracesFilePath,
+        config: evalsFilePath,
+        concurrency: 2,
+      });
+
+      expect(runAllSpy).toHaveBeenCalledTimes(5);
+      expect(maxInFlight).toBe(2);
+    });
+
+    it('should keep results in trace order', async () => {
+      const outputPath = path.join(tempDir, 'results.json');
+
+      await runEvalCommand({
+        traces: tracesFilePath,
+        config: evalsFilePath,
+        concurrency: 3,
+        output: outputPath,
+      });
+
+      const results = await fs.readJson(outputPath);
+      expect(results.results.map((r: { traceId: string }) => r.traceId)).toEqual(traceIds);
+    });
+
+    it('should reject a non-positive concurrency', async () => {
+      await expect(
+        runEvalCommand({
+          traces: tracesFilePath,
+          config: evalsFilePath,
+          concurrency: 0,
+        })
+      ).rejects.toThrow('process.exit');
+
+      expect(runAllSpy).not.toHaveBeenCalled();
+    });
+  });
+
   // ==================== REPORT COMMAND ====================
 
   describe('reportEvalCommand', () => {
@@ -7,7 +7,7 @@
 import * as fs from 'fs-extra';
 import * as path from 'path';
 import * as os from 'os';
-import { TraceStore, AnnotationStore, TaxonomyStore } from '../../src/core/storage';
+import { TraceStore, AnnotationStore, TaxonomyStore, indexAnnotationsByTrace } from '../../src/core/storage';
 import { Trace, Annotation, FailureTaxonomy } from '../../src/core/types';
 
 describe('Storage Layer', () => {
@@ -610,6 +610,47 @@ describe('Storage Layer', () => {
     });
   });
 
+  // ==================== indexAnnotationsByTrace Tests ====================
+
+  describe('indexAnnotationsByTrace()', () => {
+    const makeAnnotation = (id: string, traceId: string, label: 'pass' | 'fail'): Annotation => ({
+      id,
+      traceId,
+      annotator: 'test@example.com',
+      timestamp: new Date().toISOString(),
+      label,
+      notes: '',
+      duration: 1000,
+      source: 'manual',
+    });
+
+    it('should return empty map for no annotations', () => {
+      expect(indexAnnotationsByTrace([]).size).toBe(0);
+    });
+
+    it('should index annotations by trace ID', () => {
+      const index = indexAnnotationsByTrace([
+        makeAnnotation('ann-001', 'trace-001', 'pass'),
+        makeAnnotation('ann-002', 'trace-002', 'fail'),
+      ]);
+
+      expect(index.size).toBe(2);
+      expect(index.get('trace-001')?.id).toBe('ann-001');
+      expect(index.get('trace-002')?.id).toBe('ann-002');
+      expect(index.get('trace-003')).toBeUndefined();
+    });
+
+    it('should keep the first annotation for a trace', () => {
+      const index = indexAnnotationsByTrace([
+        makeAnnotation('ann-001', 'trace-001', 'pass'),
+        makeAnnotation('ann-002', 'trace-001', 'fail'),
+      ]);
+
+      expect(index.size).toBe(1);
+      expect(index.get('trace-001')?.id).toBe('ann-001');
+    });
+  });
+
   // ==================== TaxonomyStore Tests ====================
 
   describe('TaxonomyStore', () => {
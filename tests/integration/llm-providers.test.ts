@@ -23,7 +23,10 @@ import {
   DEFAULT_MODELS,
   cosineSimilarity,
   evaluateSemanticSimilarity,
+  withRetry,
+  ProviderAPIError,
 } from '../../src/utils/llm-providers';
+import { GoogleGenerativeAIError } from '@google/generative-ai';
 
 describe('LLM Providers - Integration', () => {
     describe('GeminiProvider', () => {
@@ -718,6 +721,153 @@ describe('LLM Providers - Integration', () => {
     }, 30000);
   });
 
+  describe('Retry on Transient Errors', () => {
+    describe('withRetry()', () => {
+      it('should retry transient API errors until success', async () => {
+        const fn = jest.fn()
+          .mockRejectedValueOnce(new ProviderAPIError('overloaded', 503))
+          .mockRejectedValueOnce(new ProviderAPIError('rate limited', 429))
+          .mockResolvedValueOnce('ok');
+
+        await expect(withRetry(fn, { baseDelayMs: 0 })).resolves.toBe('ok');
+        expect(fn).toHaveBeenCalledTimes(3);
+      });
+
+      it('should not retry permanent API errors', async () => {
+        const fn = jest.fn().mockRejectedValue(new ProviderAPIError('unauthorized', 401));
+
+        await expect(withRetry(fn, { baseDelayMs: 0 })).rejects.toThrow('unauthorized');
+        expect(fn).toHaveBeenCalledTimes(1);
+      });
+
+      it('should retry fetch network failures', async () => {
+        const cause = Object.assign(new Error('connect ECONNREFUSED 127.0.0.1:1234'), { code: 'ECONNREFUSED' });
+        const fn = jest.fn()
+          .mockRejectedValueOnce(new TypeError('fetch failed', { cause }))
+          .mockResolvedValueOnce('ok');
+
+        await expect(withRetry(fn, { baseDelayMs: 0 })).resolves.toBe('ok');
+        expect(fn).toHaveBeenCalledTimes(2);
+      });
+
+      it('should not retry fetch errors caused by a malformed URL', async () => {
+        const fn = jest.fn()
+          .mockRejectedValue(new TypeError('Failed to parse URL from localhost:1234/v1/chat/completions'));
+
+        await expect(withRetry(fn, { baseDelayMs: 0 })).rejects.toThrow('Failed to parse URL');
+        expect(fn).toHaveBeenCalledTimes(1);
+      });
+
+      it('should not retry fetch errors caused by an unknown scheme', async () => {
+        const fn = jest.fn()
+          .mockRejectedValue(new TypeError('fetch failed', { cause: new Error('unknown scheme') }));
+
+        await expect(withRetry(fn, { baseDelayMs: 0 })).rejects.toThrow('fetch failed');
+        expect(fn).toHaveBeenCalledTimes(1);
+      });
+
+      it('should not retry malformed base URLs through the provider', async () => {
+        const provider = new OpenAICompatibleProvider({ apiKey: 'test-key', baseUrl: 'localhost:1234/v1' });
+        const fetchSpy = jest.spyOn(global, 'fetch');
+
+        try {
+          await expect(provider.judge('test', 'gpt-4o-mini', 0)).rejects.toThrow(TypeError);
+          expect(fetchSpy).toHaveBeenCalledTimes(1);
+        } finally {
+          fetchSpy.mockRestore();
+        }
+      });
+
+      it('should retry Gemini SDK network failures', async () => {
+        const fn = jest.fn()
+          .mockRejectedValueOnce(new GoogleGenerativeAIError(
+            'Error fetching from https://generativelanguage.googleapis.com/v1beta/models: fetch failed'
+          ))
+          .mockResolvedValueOnce('ok');
+
+        await expect(withRetry(fn, { baseDelayMs: 0 })).resolves.toBe('ok');
+        expect(fn).toHaveBeenCalledTimes(2);
+      });
+
+      it('should not retry other Gemini SDK errors', async () => {
+        const fn = jest.fn().mockRejectedValue(new GoogleGenerativeAIError('Candidate was blocked'));
+
+        await expect(withRetry(fn, { baseDelayMs: 0 })).rejects.toThrow('Candidate was blocked');
+        expect(fn).toHaveBeenCalledTimes(1);
+      });
+
+      it('should give up after the configured attempts', async () => {
+        const fn = jest.fn().mockRejectedValue(new ProviderAPIError('overloaded', 503));
+
+        await expect(withRetry(fn, { attempts: 2, baseDelayMs: 0 })).rejects.toThrow('overloaded');
+        expect(fn).toHaveBeenCalledTimes(2);
+      });
+    });
+
+    describe('OpenAICompatibleProvider with mocked fetch', () => {
+      let fetchSpy: jest.SpyInstance;
+      const okResponse = () => new Response(
+        JSON.stringify({ choices: [{ message: { content: 'PASS' } }] }),
+        { status: 200 }
+      );
+
+      beforeEach(() => {
+        jest.useFakeTimers();
+        fetchSpy = jest.spyOn(global, 'fetch');
+      });
+
+      afterEach(() => {
+        fetchSpy.mockRestore();
+        jest.useRealTimers();
+      });
+
+      const createProvider = () =>
+        new OpenAICompatibleProvider({ apiKey: 'test-key', baseUrl: 'https://api.openai.com/v1' });
+
+      it('should retry after a 503 and return the next response', async () => {
+        fetchSpy
+          .mockResolvedValueOnce(new Response('overloaded', { status: 503 }))
+          .mockResolvedValueOnce(okResponse());
+
+        const promise = createProvider().judge('test', 'gpt-4o-mini', 0);
+        await jest.advanceTimersByTimeAsync(1000);
+
+        await expect(promise).resolves.toBe('PASS');
+        expect(fetchSpy).toHaveBeenCalledTimes(2);
+      });
+
+      it('should fail on the first attempt for a 401', async () => {
+        fetchSpy.mockResolvedValueOnce(new Response('invalid key', { status: 401 }));
+
+        await expect(createProvider().judge('test', 'gpt-4o-mini', 0)).rejects.toMatchObject({
+          name: 'ProviderAPIError',
+          status: 401,
+        });
+        expect(fetchSpy).toHaveBeenCalledTimes(1);
+      });
+
+      it('should throw after three consecutive 503s', async () => {
+        fetchSpy.mockImplementation(async () => new Response('overloaded', { status: 503 }));
+
+        const promise = createProvider().judge('test', 'gpt-4o-mini', 0);
+        const assertion = expect(promise).rejects.toThrow(/API error: 503/);
+        await jest.advanceTimersByTimeAsync(3000);
+
+        await assertion;
+        expect(fetchSpy).toHaveBeenCalledTimes(3);
+      });
+
+      it('should make a single attempt when retries are disabled', async () => {
+        fetchSpy.mockImplementation(async () => new Response('rate limited', { status: 429 }));
+
+        await expect(
+          createProvider().judge('test', 'gpt-4o-mini', 0, { attempts: 1 })
+        ).rejects.toThrow(/API error: 429/);
+        expect(fetchSpy).toHaveBeenCalledTimes(1);
+      });
+    });
+  });
+
   describe('Model Catalogs', () => {
     it('should have all Gemini models defined', () => {
       const models = Object.keys(GEMINI_MODELS);